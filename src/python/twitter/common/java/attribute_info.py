@@ -38,7 +38,7 @@ class AttributeInfo(object):
     self._attribute_name       = constants[self._attribute_name_index]
     self._attribute_length     = u4(data[2:6]).get()
     self._size                 = 6 + self._attribute_length
-    self._info_data            = data[6:self._size]
+    self._info_data            = to_bytes(data[6:self._size])
 
   def name(self):
     return self._attribute_name
@@ -83,7 +83,9 @@ class Code(AttributeInfo):
 
   def __init__(self, data, constants):
     AttributeInfo.__init__(self, data, constants)
-    bytes = self.bytes()
+    # Walk the body through a view: the bytecode and exception table are skipped over, and nested
+    # attributes are sliced off the remainder, neither of which needs to copy anything.
+    bytes = byte_view(self.bytes())
 
     (max_stack, max_locals, code_length), bytes = JavaNativeType.parse(bytes, u2, u2, u4)
     self._code_length = code_length
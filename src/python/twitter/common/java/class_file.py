@@ -95,7 +95,11 @@ class ClassFile(object):
   def __init__(self, data):
     self._data = data
     self._decode()
-    self._track_dependencies()
+    # Linkage references are resolved on first use: many callers only want the version, this and
+    # super class, or access flags, and never pay for walking the pool.
+    self._linkage_references = None
+    self._external_references = None
+    self._linkage_signature = None
 
   def _linkage_constants(self):
     return [
@@ -103,14 +107,23 @@ class ClassFile(object):
       if isinstance(c, self._LINKAGE_CONSTANT_TYPES)]
 
   def linkage_signature(self):
-    cs = [c(self._constant_pool) for c in self._linkage_constants()]
-    m = md5()
-    m.update('\n'.join(sorted(cs)))
-    return m.hexdigest()
-
-  def _track_dependencies(self):
-    self._external_references = set(
-      c(self._constant_pool) for c in self._linkage_constants())
+    if self._linkage_signature is None:
+      m = md5()
+      m.update('\n'.join(sorted(self._resolved_linkage_references())))
+      self._linkage_signature = m.hexdigest()
+    return self._linkage_signature
+
+  def _resolved_linkage_references(self):
+    # Resolve each linkage constant against the pool once; both the external references and the
+    # linkage signature are derived from these.
+    if self._linkage_references is None:
+      self._linkage_references = [c(self._constant_pool) for c in self._linkage_constants()]
+    return self._linkage_references
+
+  def _tracked_external_references(self):
+    if self._external_references is None:
+      self._external_references = set(self._resolved_linkage_references())
+    return self._external_references
 
   @staticmethod
   def from_fp(fp):
@@ -122,7 +135,9 @@ class ClassFile(object):
       return ClassFile.from_fp(fp)
 
   def _decode(self):
-    data = self._data
+    # Each decoding step hands the rest of the file to the next one; a byte view makes that a
+    # constant-time slice instead of a copy of everything that follows.
+    data = byte_view(self._data)
 
     (self._magic, self._minor_version, self._major_version), data = \
       JavaNativeType.parse(data, u4, u2, u2)
@@ -211,9 +226,10 @@ class ClassFile(object):
       output.append("attributes: ")
       for attribute in self._attributes:
         output.append("  %s" % attribute)
-    if self._external_references:
+    external_references = self._tracked_external_references()
+    if external_references:
       output.append("external references: ")
-      for ref in self._external_references:
+      for ref in external_references:
         output.append("  %s" % ref)
     output.append("linkage signature: \n  %s" % self.linkage_signature())
     return '\n'.join(output)
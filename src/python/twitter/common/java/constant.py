@@ -23,6 +23,9 @@ from .java_types import *
 """
 
 class ConstantBase(object):
+  # A class file can have tens of thousands of constants, so none of them carry a __dict__.
+  __slots__ = ()
+
   def __call__(self, constants):
     return 'AnonymousConstant()'
 
@@ -38,6 +41,7 @@ class ClassConstant(ConstantBase):
     u1 tag
     u2 name_index
   """
+  __slots__ = ('_tag', '_name_index')
   TYPES = [u1, u2]
 
   def __init__(self, data):
@@ -53,6 +57,7 @@ class FieldrefConstant(ConstantBase):
     u2 class_index
     u2 name_and_type_index
   """
+  __slots__ = ('_tag', '_class_index', '_name_and_type_index')
 
   TYPES = [u1, u2, u2]
 
@@ -70,6 +75,7 @@ class MethodrefConstant(ConstantBase):
     u2 class_index
     u2 name_and_type_index
   """
+  __slots__ = ('_tag', '_class_index', '_name_and_type_index')
 
   TYPES = [u1, u2, u2]
 
@@ -87,6 +93,7 @@ class InterfaceMethodrefConstant(ConstantBase):
     u2 class_index
     u2 name_and_type_index
   """
+  __slots__ = ('_tag', '_class_index', '_name_and_type_index')
 
   TYPES = [u1, u2, u2]
 
@@ -103,6 +110,7 @@ class StringConstant(ConstantBase):
     u1 tag
     u2 string_index
   """
+  __slots__ = ('_tag', '_string_index')
   TYPES = [u1, u2]
 
   def __init__(self, data):
@@ -113,6 +121,7 @@ class IntegerConstant(ConstantBase):
     u1 tag
     u4 bytes
   """
+  __slots__ = ('_tag', '_bytes')
   TYPES = [u1, u4]
 
   def __init__(self, data):
@@ -123,6 +132,7 @@ class FloatConstant(ConstantBase):
     u1 tag
     u4 bytes
   """
+  __slots__ = ('_tag', '_bytes')
   TYPES = [u1, u4]
 
   def __init__(self, data):
@@ -134,6 +144,7 @@ class LongConstant(ConstantBase):
     u4 high_bytes
     u4 low_bytes
   """
+  __slots__ = ('_tag', '_high_bytes', '_low_bytes')
   TYPES = [u1, u4, u4]
 
   def __init__(self, data):
@@ -145,6 +156,7 @@ class DoubleConstant(ConstantBase):
     u4 high_bytes
     u4 low_bytes
   """
+  __slots__ = ('_tag', '_high_bytes', '_low_bytes')
   TYPES = [u1, u4, u4]
 
   def __init__(self, data):
@@ -156,6 +168,7 @@ class NameAndTypeConstant(ConstantBase):
     u2 name_index
     u2 descriptor_index
   """
+  __slots__ = ('_tag', '_name_index', '_descriptor_index')
   TYPES = [u1, u2, u2]
 
   def __init__(self, data):
@@ -175,9 +188,11 @@ class Utf8Constant(ConstantBase):
     u2 length
     u1 bytes[length]
   """
+  __slots__ = ('_tag', '_length', '_bytes')
+
   def __init__(self, data):
     (self._tag, self._length), data = JavaNativeType.parse(data, u1, u2)
-    self._bytes = data[0:self._length]
+    self._bytes = to_bytes(data[0:self._length])
 
   def size(self):
     return u1.size() + u2.size() + self._length
@@ -218,7 +233,6 @@ class Constant(object):
 
   @staticmethod
   def parse(data):
-    print('parse data[0] = %s' % data[0])
-    tag = u1(data[0]).get()
+    tag = u1(data[0:1]).get()
     constant = Constant._BASE_TYPES[tag](data)
     return constant
@@ -16,6 +16,32 @@
 
 import struct
 
+try:
+  _memoryview = memoryview
+except NameError:
+  # Python 2.6 has no memoryview; fall back to decoding plain (copying) string slices.
+  _memoryview = None
+
+
+def byte_view(data):
+  """Returns a view of data that can be sliced without copying, where the interpreter supports it.
+
+  Class files are decoded through this so that walking the file doesn't copy the remainder of it
+  at every step.
+  """
+  return _memoryview(data) if _memoryview is not None else data
+
+
+def to_bytes(data):
+  """Returns data as a byte string.
+
+  Anything that holds onto a slice of a byte_view should copy it out with this.
+  """
+  if _memoryview is not None and isinstance(data, _memoryview):
+    return data.tobytes()
+  return data
+
+
 class JavaNativeType(object):
   class ParseException(Exception): pass
 
@@ -35,90 +61,119 @@ class JavaNativeType(object):
   def size():
     raise Exception("Unimplemented!")
 
+  # Maps a tuple of JavaNativeType subclasses to a single precompiled big-endian struct.Struct that
+  # unpacks all of them in one call.
+  _structs = {}
+
+  @classmethod
+  def _struct_for(cls, type_args):
+    struct_ = cls._structs.get(type_args)
+    if struct_ is None:
+      for t in type_args:
+        if not issubclass(t, JavaNativeType):
+          raise JavaNativeType.ParseException("Not a valid JavaNativeType: %s" % t)
+      struct_ = struct.Struct('>' + ''.join(t.FORMAT for t in type_args))
+      cls._structs[type_args] = struct_
+    return struct_
+
   @staticmethod
   def parse(data, *type_args):
-    offset = 0
-    parsed_types = []
-    total_size = 0
-    for t in type_args:
-      if not issubclass(t, JavaNativeType):
-        raise JavaNativeType.ParseException("Not a valid JavaNativeType: %s" % t)
-      total_size += t.size()
-    if total_size > len(data):
+    struct_ = JavaNativeType._struct_for(type_args)
+    if struct_.size > len(data):
       raise JavaNativeType.ParseException("Not enough data to deserialize %s" % repr(type_args))
-    for t in type_args:
-      parsed_type = t(data[slice(offset, offset + t.size())]).value()
-      parsed_types.append(parsed_type)
-      offset += t.size()
-    return parsed_types, data[total_size:]
+    return list(struct_.unpack_from(data)), data[struct_.size:]
 
 class u1(JavaNativeType):
+  FORMAT = 'B'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack('>B', data[0:1])[0]
+    self._value = self._STRUCT.unpack(data[0:1])[0]
 
   @staticmethod
   def size():
     return 1
 
 class u2(JavaNativeType):
+  FORMAT = 'H'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">H", data[0:2])[0]
+    self._value = self._STRUCT.unpack(data[0:2])[0]
 
   @staticmethod
   def size():
     return 2
 
 class s2(JavaNativeType):
+  FORMAT = 'h'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">h", data[0:2])[0]
+    self._value = self._STRUCT.unpack(data[0:2])[0]
 
   @staticmethod
   def size():
     return 2
 
 class u4(JavaNativeType):
+  FORMAT = 'L'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">L", data[0:4])[0]
+    self._value = self._STRUCT.unpack(data[0:4])[0]
 
   @staticmethod
   def size():
     return 4
 
 class s4(JavaNativeType):
+  FORMAT = 'l'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">l", data[0:4])[0]
+    self._value = self._STRUCT.unpack(data[0:4])[0]
 
   @staticmethod
   def size():
     return 4
 
 class s8(JavaNativeType):
+  FORMAT = 'q'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">q", data[0:8])[0]
+    self._value = self._STRUCT.unpack(data[0:8])[0]
 
   @staticmethod
   def size():
     return 8
 
 class f4(JavaNativeType):
+  FORMAT = 'f'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">f", data[0:4])[0]
+    self._value = self._STRUCT.unpack(data[0:4])[0]
 
   @staticmethod
   def size():
     return 4
 
 class f8(JavaNativeType):
+  FORMAT = 'd'
+  _STRUCT = struct.Struct('>' + FORMAT)
+
   def __init__(self, data):
     JavaNativeType.__init__(self, data)
-    self._value = struct.unpack(">d", data[0:8])[0]
+    self._value = self._STRUCT.unpack(data[0:8])[0]
 
   @staticmethod
   def size():
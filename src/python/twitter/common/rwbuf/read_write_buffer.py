@@ -1,3 +1,4 @@
+import os
 import threading
 
 from twitter.common.lang import Compatibility
@@ -68,5 +69,13 @@ class FileBackedRWBuf(_RWBuf):
     _RWBuf.__init__(self, open(backing_file, 'a+'))
     self.fileno = self._io.fileno
 
+  def read(self, size=-1):
+    # Pollers typically call this periodically on many mostly-idle buffers, and the file is often
+    # written by other processes via our fileno, so check its size first: a single fstat is cheaper
+    # than the seek/read/tell round trip when there's nothing new to read.
+    if os.fstat(self.fileno()).st_size <= self._readpos:
+      return ''
+    return _RWBuf.read(self, size)
+
   def do_write(self, s):
     self._io.write(s)
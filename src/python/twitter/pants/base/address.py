@@ -39,6 +39,16 @@ class Address(object):
   Where ``path/to/buildfile:targetname`` is the dependent target address.
   """
 
+  # One Address is allocated per target and per pants pointer, keep them lean.
+  __slots__ = ('buildfile', 'target_name', '_hash')
+
+  # (root_dir, path, target name) -> Address, scoped to a run by Target._clear_all_addresses.
+  _parsed = {}
+
+  @classmethod
+  def _clear_parse_cache(cls):
+    cls._parsed = {}
+
   @classmethod
   def parse(cls, root_dir, spec, is_relative=True):
     """Parses the given spec into an Address.
@@ -63,10 +73,16 @@ class Address(object):
     path = parts[0]
     if is_relative:
       path = os.path.relpath(os.path.abspath(path), root_dir)
-    buildfile = BuildFile(root_dir, path)
 
-    name = os.path.basename(os.path.dirname(buildfile.relpath)) if len(parts) == 1 else parts[1]
-    return Address(buildfile, name)
+    # Pants pointers re-parse the same specs once per dependency edge, memoize to avoid repeated
+    # BuildFile filesystem checks.
+    key = (root_dir, path, parts[1] if len(parts) > 1 else None)
+    address = cls._parsed.get(key)
+    if address is None:
+      buildfile = BuildFile(root_dir, path)
+      name = os.path.basename(os.path.dirname(buildfile.relpath)) if len(parts) == 1 else parts[1]
+      address = cls._parsed[key] = Address(buildfile, name)
+    return address
 
   def __init__(self, buildfile, target_name):
     """
@@ -78,6 +94,12 @@ class Address(object):
     self.buildfile = buildfile
     self.target_name = target_name
 
+    # Addresses key the target registry and are hashed on every lookup, compute the hash once.
+    value = 17
+    value *= 37 + hash(self.buildfile.canonical_relpath)
+    value *= 37 + hash(self.target_name)
+    self._hash = value
+
   def reference(self, referencing_buildfile_path=None):
     """How to reference this address in a BUILD file."""
     dirname = os.path.dirname(self.buildfile.relpath)
@@ -89,6 +111,8 @@ class Address(object):
       return dirname
 
   def __eq__(self, other):
+    if self is other:
+      return True
     result = other and (
       type(other) == Address) and (
       self.buildfile.canonical_relpath == other.buildfile.canonical_relpath) and (
@@ -96,10 +120,7 @@ class Address(object):
     return result
 
   def __hash__(self):
-    value = 17
-    value *= 37 + hash(self.buildfile.canonical_relpath)
-    value *= 37 + hash(self.target_name)
-    return value
+    return self._hash
 
   def __ne__(self, other):
     return not self.__eq__(other)
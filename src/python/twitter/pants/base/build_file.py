@@ -18,8 +18,6 @@ import marshal
 import os
 import re
 
-from glob import glob1
-
 from twitter.common.collections import OrderedSet
 from twitter.common.python.interpreter import PythonIdentity
 
@@ -37,11 +35,14 @@ class BuildFile(object):
     """Looks for all BUILD files under base_path"""
 
     buildfiles = []
+    is_buildfile_name = BuildFile._PATTERN.match
     for root, dirs, files in os.walk(base_path if base_path else root_dir):
+      reldir = None
       for filename in files:
-        if BuildFile._is_buildfile_name(filename):
-          buildfile_relpath = os.path.relpath(os.path.join(root, filename), root_dir)
-          buildfiles.append(BuildFile(root_dir, buildfile_relpath))
+        if is_buildfile_name(filename):
+          if reldir is None:
+            reldir = os.path.relpath(root, root_dir)
+          buildfiles.append(BuildFile(root_dir, os.path.join(reldir, filename)))
     return OrderedSet(sorted(buildfiles, key=lambda buildfile: buildfile.full_path))
 
   def __init__(self, root_dir, relpath, must_exist=True):
@@ -67,9 +68,6 @@ class BuildFile(object):
       if not BuildFile._is_buildfile_name(os.path.basename(buildfile)):
         raise IOError("%s is not a BUILD file" % buildfile)
 
-      if not os.path.exists(buildfile):
-        raise IOError("BUILD file does not exist at: %s" % buildfile)
-
     self.root_dir = os.path.realpath(root_dir)
     self.full_path = os.path.realpath(buildfile)
 
@@ -121,11 +119,13 @@ class BuildFile(object):
     """Returns an iterator over all the BUILD files co-located with this BUILD file not including
     this BUILD file itself"""
 
-    for build in glob1(self.parent_path, 'BUILD*'):
+    # A single directory listing tells us every sibling that exists and has a valid name, so skip
+    # re-checking both when constructing each sibling.
+    reldir = os.path.dirname(self.relpath)
+    for build in os.listdir(self.parent_path):
       if self.name != build and BuildFile._is_buildfile_name(build):
-        siblingpath = os.path.join(os.path.dirname(self.relpath), build)
-        if not os.path.isdir(os.path.join(self.root_dir, siblingpath)):
-          yield BuildFile(self.root_dir, siblingpath)
+        if not os.path.isdir(os.path.join(self.parent_path, build)):
+          yield BuildFile(self.root_dir, os.path.join(reldir, build), must_exist=False)
 
   def family(self):
     """Returns an iterator over all the BUILD files co-located with this BUILD file including this
@@ -143,11 +143,26 @@ class BuildFile(object):
       with open(self._bytecode_path, 'rb') as bytecode:
         return marshal.load(bytecode)
     else:
-      with open(self.full_path, 'rb') as source:
-        code = compile(source.read(), self.full_path, 'exec')
-        with open(self._bytecode_path, 'wb') as bytecode:
-          marshal.dump(code, bytecode)
-        return code
+      code = compile(self._read_source(), self.full_path, 'exec')
+      with open(self._bytecode_path, 'wb') as bytecode:
+        marshal.dump(code, bytecode)
+      return code
+
+  def _read_source(self):
+    # BUILD files are small, so read them with a single fstat-sized read rather than going through
+    # a buffered file object; compile handles any source encoding declaration itself.
+    fd = os.open(self.full_path, os.O_RDONLY)
+    try:
+      size = os.fstat(fd).st_size
+      source = os.read(fd, size)
+      while len(source) < size:
+        chunk = os.read(fd, size - len(source))
+        if not chunk:
+          break
+        source += chunk
+      return source
+    finally:
+      os.close(fd)
 
   def __eq__(self, other):
     result = other and (
@@ -106,8 +106,8 @@ class CacheKeyGenerator(object):
       combined_id = Target.maybe_readable_combine_ids(cache_key.id for cache_key in cache_keys)
       combined_hash = hash_all(sorted(cache_key.hash for cache_key in cache_keys))
       combined_num_sources = sum(cache_key.num_sources for cache_key in cache_keys)
-      combined_sources = \
-        sorted(list(itertools.chain(*[cache_key.sources for cache_key in cache_keys])))
+      combined_sources = sorted(
+          itertools.chain.from_iterable(cache_key.sources for cache_key in cache_keys))
       return CacheKey(combined_id, combined_hash, combined_num_sources, combined_sources)
 
   def __init__(self, cache_key_gen_version=None):
@@ -187,6 +187,10 @@ class BuildInvalidator(object):
   def __init__(self, root):
     self._root = os.path.join(root, GLOBAL_CACHE_KEY_GEN_VERSION)
     safe_mkdir(self._root)
+    # Ids known to have no hash file. Hashes themselves are always read from disk, so an update made
+    # through another invalidator over the same root is never masked; a stale miss only costs a
+    # rebuild.
+    self._missing_ids = set()
 
   def needs_update(self, cache_key):
     """Check if the given cached item is invalid.
@@ -214,6 +218,7 @@ class BuildInvalidator(object):
     except OSError as e:
       if e.errno != errno.ENOENT:
         raise
+    self._missing_ids.add(cache_key.id)
 
   def existing_hash(self, id):
     """Returns the existing hash for the specified id.
@@ -231,15 +236,19 @@ class BuildInvalidator(object):
   def _write_sha(self, cache_key):
     with open(self._sha_file(cache_key), 'w') as fd:
       fd.write(cache_key.hash)
+    self._missing_ids.discard(cache_key.id)
 
   def _read_sha(self, cache_key):
     return self._read_sha_by_id(cache_key.id)
 
   def _read_sha_by_id(self, id):
+    if id in self._missing_ids:
+      return None
     try:
       with open(self._sha_file_by_id(id), 'rb') as fd:
         return fd.read().strip()
     except IOError as e:
       if e.errno != errno.ENOENT:
         raise
+      self._missing_ids.add(id)
       return None  # File doesn't exist.
@@ -41,17 +41,25 @@ class MustacheRenderer(object):
     self._template_dir = template_dir
     self._package_name = package_name
     self._pystache_renderer = pystache.Renderer(search_dirs=template_dir)
+    self._parsed_templates = {}  # template name -> pystache ParsedTemplate.
 
   def render_name(self, template_name, args):
-    # TODO: Precompile and cache the templates?
     if self._template_dir:
-      # Let pystache find the template by name.
+      # Let pystache find the template by name. We don't cache these, so that edits to templates
+      # in template_dir are picked up immediately.
       return self._pystache_renderer.render_name(template_name, MustacheRenderer.expand(args))
     else:
-      # Load the named template embedded in our package.
-      template = pkgutil.get_data(self._package_name,
-                                  os.path.join('templates', template_name + '.mustache'))
-      return self.render(template, args)
+      # Load and parse the named template embedded in our package, once.
+      return self.render(self._parsed_template(template_name), args)
+
+  def _parsed_template(self, template_name):
+    template = self._parsed_templates.get(template_name)
+    if template is None:
+      template_text = pkgutil.get_data(self._package_name,
+                                       os.path.join('templates', template_name + '.mustache'))
+      template = pystache.parse(template_text.decode('utf-8'))
+      self._parsed_templates[template_name] = template
+    return template
 
   def render(self, template, args):
     return self._pystache_renderer.render(template, MustacheRenderer.expand(args))
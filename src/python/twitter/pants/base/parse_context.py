@@ -15,7 +15,6 @@
 # ==================================================================================================
 
 import collections
-import copy
 import os
 
 from functools import partial
@@ -40,6 +39,9 @@ class ParseContext(object):
 
   _active = collections.deque([])
   _parsed = set()
+  _globals_by_headers = {}
+  _config = None
+  _config_stamp = None
 
   _strs_to_exec = [
     "from twitter.pants.base.build_file_context import *",
@@ -121,19 +123,46 @@ class ParseContext(object):
 
     You may also need to add new roots to the sys.path. see _run in pants_exe.py
     """
+    return cls._base_globals(config).copy()
+
+  @classmethod
+  def _base_globals(cls, config=None):
+    """Returns the shared, rel_path independent globals BUILD files are exec'd against.
+
+    The result is cached by the exact headers exec'd to produce it and must not be mutated.
+    """
     to_exec = list(cls._strs_to_exec)
     if config:
       # TODO: This can be replaced once extensions are enabled with
       # https://github.com/pantsbuild/pants/issues/5
       to_exec.extend(config.getlist('parse', 'headers', default=[]))
 
-    pants_context = {}
-    for str_to_exec in to_exec:
-      ast = compile(str_to_exec, '<string>', 'exec')
-      Compatibility.exec_function(ast, pants_context)
+    key = tuple(to_exec)
+    pants_context = cls._globals_by_headers.get(key)
+    if pants_context is None:
+      pants_context = {}
+      for str_to_exec in to_exec:
+        ast = compile(str_to_exec, '<string>', 'exec')
+        Compatibility.exec_function(ast, pants_context)
+      cls._globals_by_headers[key] = pants_context
 
     return pants_context
 
+  @classmethod
+  def _load_config(cls):
+    """Returns the build root's pants.ini Config, re-reading it only when the file changes."""
+    configpath = os.path.join(get_buildroot(), 'pants.ini')
+    try:
+      stat = os.stat(configpath)
+    except OSError:
+      # No pants.ini to key on, let Config.load handle the missing file as it always has.
+      return Config.load(configpath)
+    stamp = (configpath, stat.st_mtime, stat.st_size)
+    if cls._config_stamp != stamp:
+      cls._config = Config.load(configpath)
+      cls._config_stamp = stamp
+    return cls._config
+
   def parse(self, **globalargs):
     """The entry point to parsing of a BUILD file.
 
@@ -144,7 +173,43 @@ class ParseContext(object):
     if self.buildfile not in ParseContext._parsed:
       buildfile_family = tuple(self.buildfile.family())
 
-      pants_context = self.default_globals(Config.load())
+      pants_context = self._base_globals(self._load_config())
+
+      # TODO(John Sirois): XXX imports are done here to prevent a cycles
+      from twitter.pants.targets.jvm_binary import Bundle
+      from twitter.pants.targets.sources import SourceRoot
+
+      # All BUILD files in a family share a directory, so the path-relative helpers they see are
+      # built once per family rather than once per file.
+      buildfile_dir = self.buildfile.parent_path
+
+      class RelativeBundle(Bundle):
+        def __init__(self, mapper=None, relative_to=None):
+          super(RelativeBundle, self).__init__(
+              base=buildfile_dir,
+              mapper=mapper,
+              relative_to=relative_to)
+
+      # TODO(John Sirois): This is not build-dictionary friendly - rework SourceRoot to allow
+      # allow for doc of both register (as source_root) and source_root.here(*types).
+      class RelativeSourceRoot(object):
+        @staticmethod
+        def here(*allowed_target_types):
+          """Registers the cwd as a source root for the given target types."""
+          SourceRoot.register(buildfile_dir, *allowed_target_types)
+
+        def __init__(self, basedir, *allowed_target_types):
+          SourceRoot.register(os.path.join(buildfile_dir, basedir), *allowed_target_types)
+
+      family_globals = pants_context.copy()
+      family_globals.update({
+        'ROOT_DIR': self.buildfile.root_dir,
+        'globs': partial(Fileset.globs, root=buildfile_dir),
+        'rglobs': partial(Fileset.rglobs, root=buildfile_dir),
+        'zglobs': partial(Fileset.zglobs, root=buildfile_dir),
+        'source_root': RelativeSourceRoot,
+        'bundle': RelativeBundle
+      })
 
       with ParseContext.activate(self):
         for buildfile in buildfile_family:
@@ -153,41 +218,10 @@ class ParseContext(object):
           if buildfile not in ParseContext._parsed:
             ParseContext._parsed.add(buildfile)
 
-            buildfile_dir = os.path.dirname(buildfile.full_path)
-
-            # TODO(John Sirois): XXX imports are done here to prevent a cycles
-            from twitter.pants.targets.jvm_binary import Bundle
-            from twitter.pants.targets.sources import SourceRoot
-
-            class RelativeBundle(Bundle):
-              def __init__(self, mapper=None, relative_to=None):
-                super(RelativeBundle, self).__init__(
-                    base=buildfile_dir,
-                    mapper=mapper,
-                    relative_to=relative_to)
-
-            # TODO(John Sirois): This is not build-dictionary friendly - rework SourceRoot to allow
-            # allow for doc of both register (as source_root) and source_root.here(*types).
-            class RelativeSourceRoot(object):
-              @staticmethod
-              def here(*allowed_target_types):
-                """Registers the cwd as a source root for the given target types."""
-                SourceRoot.register(buildfile_dir, *allowed_target_types)
-
-              def __init__(self, basedir, *allowed_target_types):
-                SourceRoot.register(os.path.join(buildfile_dir, basedir), *allowed_target_types)
-
-            eval_globals = copy.copy(pants_context)
-            eval_globals.update({
-              'ROOT_DIR': buildfile.root_dir,
-              '__file__': buildfile.full_path,
-              'globs': partial(Fileset.globs, root=buildfile_dir),
-              'rglobs': partial(Fileset.rglobs, root=buildfile_dir),
-              'zglobs': partial(Fileset.zglobs, root=buildfile_dir),
-              'source_root': RelativeSourceRoot,
-              'bundle': RelativeBundle
-            })
-            eval_globals.update(globalargs)
+            eval_globals = family_globals.copy()
+            eval_globals['__file__'] = buildfile.full_path
+            if globalargs:
+              eval_globals.update(globalargs)
             Compatibility.exec_function(buildfile.code(), eval_globals)
 
   def on_context_exit(self, func, *args, **kwargs):
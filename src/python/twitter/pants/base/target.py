@@ -198,6 +198,7 @@ class Target(AbstractTarget):
   def _clear_all_addresses(cls):
     cls._targets_by_address = {}
     cls._addresses_by_buildfile = collections.defaultdict(OrderedSet)
+    Address._clear_parse_cache()
 
   @classmethod
   def get(cls, address):
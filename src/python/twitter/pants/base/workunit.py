@@ -75,6 +75,11 @@ class WorkUnit(object):
     self.parent = parent
     self.children = []
 
+    # A workunit's place in the tree never changes, and reporters ask for it on every log line
+    # and every chunk of output, so compute it once here rather than walking up each time.
+    self._root = parent._root if parent else self
+    self._depth = parent._depth + 1 if parent else 1
+
     self.name = name
     self.labels = set(labels or ())
     self.cmd = cmd
@@ -162,10 +167,11 @@ class WorkUnit(object):
     return '%02d:%02d' % (delta / 60, delta % 60)
 
   def root(self):
-    ret = self
-    while ret.parent is not None:
-      ret = ret.parent
-    return ret
+    return self._root
+
+  def depth(self):
+    """Returns the number of workunits from this one up to the root, inclusive."""
+    return self._depth
 
   def ancestors(self):
     """Returns a list consisting of this workunit and those enclosing it, up to the root."""
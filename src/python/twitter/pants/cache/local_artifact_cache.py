@@ -1,3 +1,4 @@
+import errno
 import os
 import shutil
 import uuid
@@ -33,32 +34,28 @@ class LocalArtifactCache(ArtifactCache):
     # Write to a temporary name (on the same filesystem), and move it atomically, so if we
     # crash in the middle we don't leave an incomplete or missing artifact.
     tarfile_tmp = tarfile + '.' + str(uuid.uuid4()) + '.tmp'
-    if os.path.exists(tarfile_tmp):
-      os.unlink(tarfile_tmp)
 
     artifact = TarballArtifact(self.artifact_root, tarfile_tmp, self._compress)
     artifact.collect(paths)
     # Note: Race condition here if multiple pants runs (in different workspaces)
     # try to write the same thing at the same time. However since rename is atomic,
-    # this should not result in corruption. It may however result in a missing artifact
-    # If we crash between the unlink and the rename. But that's OK.
-    if os.path.exists(tarfile):
-      os.unlink(tarfile)
+    # and atomically replaces any existing artifact, this should not result in corruption.
     os.rename(tarfile_tmp, tarfile)
 
   def has(self, cache_key):
     return os.path.isfile(self._cache_file_for_key(cache_key))
 
   def use_cached_files(self, cache_key):
+    tarfile = self._cache_file_for_key(cache_key)
     try:
-      tarfile = self._cache_file_for_key(cache_key)
-      if os.path.exists(tarfile):
-        artifact = TarballArtifact(self.artifact_root, tarfile, self._compress)
-        artifact.extract()
-        return artifact
-      else:
-        return None
+      # Just try to open the tarball rather than stat it first: a miss costs the same single
+      # syscall and a hit saves one.
+      artifact = TarballArtifact(self.artifact_root, tarfile, self._compress)
+      artifact.extract()
+      return artifact
     except Exception as e:
+      if isinstance(e, IOError) and e.errno == errno.ENOENT and e.filename == tarfile:
+        return None  # Cache miss.
       self.log.warn('Error while reading from local artifact cache: %s' % e)
       return None
 
@@ -71,5 +68,5 @@ class LocalArtifactCache(ArtifactCache):
   def _cache_file_for_key(self, cache_key):
     # Note: it's important to use the id as well as the hash, because two different targets
     # may have the same hash if both have no sources, but we may still want to differentiate them.
-    return os.path.join(self._cache_root, cache_key.id, cache_key.hash) + \
-           '.tar.gz' if self._compress else '.tar'
+    suffix = '.tar.gz' if self._compress else '.tar'
+    return os.path.join(self._cache_root, cache_key.id, cache_key.hash) + suffix
@@ -77,7 +77,7 @@ class HtmlReporter(Reporter):
       workunit_dict['cmd'] = linkify(self._buildroot, workunit_dict['cmd'].replace('$', '\\\\$'))
 
     # Create the template arguments.
-    args = { 'indent': len(workunit.ancestors()) * 10,
+    args = { 'indent': workunit.depth() * 10,
              'html_path_base': self._html_path_base,
              'workunit': workunit_dict,
              'header_text': workunit.name,
@@ -256,15 +256,21 @@ class HtmlReporter(Reporter):
 
   def _htmlify_text(self, s):
     """Make text HTML-friendly."""
-    colored = self._handle_ansi_color_codes(cgi.escape(str(s)))
-    return linkify(self._buildroot, colored).replace('\n', '</br>')
+    escaped = cgi.escape(str(s))
+    colored = self._handle_ansi_color_codes(escaped)
+    if '/' in escaped:  # Every path or URL linkify could find contains a slash.
+      colored = linkify(self._buildroot, colored)
+    return colored.replace('\n', '</br>')
+
+  _ANSI_COLOR_CODE_RE = re.compile(r'\033\[([\d;]*)m')
+
+  @staticmethod
+  def _ansi_code_to_span(m):
+    return '</span><span class="%s">' % ' '.join(['ansi-%s' % c for c in m.group(1).split(';')])
 
-  _ANSI_COLOR_CODE_RE = re.compile(r'\033\[((\d|;)*)m')
   def _handle_ansi_color_codes(self, s):
     """Replace ansi color sequences with spans of appropriately named css classes."""
-    def ansi_code_to_css(code):
-      return ' '.join(['ansi-%s' % c for c in code.split(';')])
-    return '<span>' +\
-           HtmlReporter._ANSI_COLOR_CODE_RE.sub(
-             lambda m: '</span><span class="%s">' % ansi_code_to_css(m.group(1)), s) +\
+    if '\033' not in s:
+      return '<span>' + s + '</span>'
+    return '<span>' + HtmlReporter._ANSI_COLOR_CODE_RE.sub(HtmlReporter._ansi_code_to_span, s) + \
            '</span>'
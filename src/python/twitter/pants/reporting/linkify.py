@@ -7,10 +7,12 @@ from twitter.pants.base.build_file import BuildFile
 # A regex to recognize substrings that are probably URLs or file paths. Broken down for readability.
 _PREFIX = r'(https?://)?/?' # http://, https:// or / or nothing.
 _OPTIONAL_PORT = r'(:\d+)?'
-_REL_PATH_COMPONENT = r'(\w|[-.])+'  # One or more alphanumeric, underscore, dash or dot.
+# A single character class rather than an alternation group, so the regex engine doesn't push a
+# backtracking point (and a capture) for every character of every path.
+_REL_PATH_COMPONENT = r'[\w.-]+'  # One or more alphanumeric, underscore, dash or dot.
 _ABS_PATH_COMPONENT = r'/' + _REL_PATH_COMPONENT
-_ABS_PATH_COMPONENTS = r'(%s)+' % _ABS_PATH_COMPONENT
-_OPTIONAL_TARGET_SUFFIX = r'(:%s)?' % _REL_PATH_COMPONENT  # For /foo/bar:target.
+_ABS_PATH_COMPONENTS = r'(?:%s)+' % _ABS_PATH_COMPONENT
+_OPTIONAL_TARGET_SUFFIX = r'(?::%s)?' % _REL_PATH_COMPONENT  # For /foo/bar:target.
 
 # Note that we require at least two path components.
 # We require the last characgter to be alphanumeric or underscore, because some tools print an
@@ -20,11 +22,22 @@ _PATH = _PREFIX + _REL_PATH_COMPONENT + _OPTIONAL_PORT + _ABS_PATH_COMPONENTS +
         _OPTIONAL_TARGET_SUFFIX + '\w'
 _PATH_RE = re.compile(_PATH)
 
+# Maps (buildroot, matched text) -> url. The same paths recur across thousands of report lines, so
+# this saves the stat calls in to_url below. Only paths that resolved are cached, so a file that
+# appears later in the run (e.g. a generated file or report) still gets linked. Bounded so the
+# HtmlReporter of a long build doesn't grow it without limit.
+_URL_CACHE = {}
+_URL_CACHE_MAX_SIZE = 4096
+
 def linkify(buildroot, s):
   """Augment text by heuristically finding URL and file references and turning them into links/"""
   def to_url(m):
     if m.group(1):
       return m.group(0)  # It's an http(s) url.
+    key = (buildroot, m.group(0))
+    url = _URL_CACHE.get(key)
+    if url:
+      return url
     path = m.group(0)
     if path.startswith('/'):
       path = os.path.relpath(path, buildroot)
@@ -40,9 +53,13 @@ def linkify(buildroot, s):
         path = os.path.join(putative_dir, BuildFile._CANONICAL_NAME)
     if os.path.exists(os.path.join(buildroot, path)):
       # The reporting server serves file content at /browse/<path_from_buildroot>.
-      return '/browse/%s' % path
+      url = '/browse/%s' % path
     else:
       return None
+    if len(_URL_CACHE) >= _URL_CACHE_MAX_SIZE:
+      _URL_CACHE.clear()
+    _URL_CACHE[key] = url
+    return url
 
   def maybe_add_link(url, text):
     return '<a target="_blank" href="%s">%s</a>' % (url, text) if url else text
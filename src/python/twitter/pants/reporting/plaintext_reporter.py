@@ -150,7 +150,7 @@ class PlainTextReporter(Reporter):
                for x in stats])
 
   def _indent(self, workunit):
-    return '  ' * (len(workunit.ancestors()) - 1)
+    return '  ' * (workunit.depth() - 1)
 
   _time_string_filler = ' ' * len('HH:MM:SS mm:ss ')
   def _prefix(self, workunit, s):
@@ -15,7 +15,6 @@
 # ==================================================================================================
 
 import collections
-import copy
 
 from functools import partial
 
@@ -47,7 +46,13 @@ class InternalTarget(Target):
     visited = set()
     path = OrderedSet()
 
-    def invert(target):
+    # Both walks below use an explicit stack of (target, remaining edges) instead of recursion so
+    # that deep dependency graphs neither pay per-edge frame setup nor hit the recursion limit.
+
+    def enter(target):
+      """Returns an iterator over the dependencies of target left to invert or None if there are
+      none.
+      """
       if target in path:
         path_list = list(path)
         cycle_head = path_list.index(target)
@@ -57,30 +62,44 @@ class InternalTarget(Target):
       if target not in visited:
         visited.add(target)
         if getattr(target, 'internal_dependencies', None):
-          for internal_dependency in target.internal_dependencies:
-            if hasattr(internal_dependency, 'internal_dependencies'):
-              inverted_deps[internal_dependency].add(target)
-              invert(internal_dependency)
-        else:
-          roots.add(target)
-      path.remove(target)
+          return iter(target.internal_dependencies)
+        roots.add(target)
+      path.discard(target)
+      return None
 
     for internal_target in internal_targets:
-      invert(internal_target)
+      dependencies = enter(internal_target)
+      stack = [(internal_target, dependencies)] if dependencies else []
+      while stack:
+        target, dependencies = stack[-1]
+        for internal_dependency in dependencies:
+          if hasattr(internal_dependency, 'internal_dependencies'):
+            inverted_deps[internal_dependency].add(target)
+            transitive_dependencies = enter(internal_dependency)
+            if transitive_dependencies:
+              stack.append((internal_dependency, transitive_dependencies))
+              break
+        else:
+          stack.pop()
+          path.discard(target)
 
     ordered = []
     visited.clear()
 
-    def topological_sort(target):
-      if target not in visited:
-        visited.add(target)
-        if target in inverted_deps:
-          for dep in inverted_deps[target]:
-            topological_sort(dep)
-        ordered.append(target)
-
     for root in roots:
-      topological_sort(root)
+      if root not in visited:
+        visited.add(root)
+        stack = [(root, iter(inverted_deps.get(root, ())))]
+        while stack:
+          target, dependents = stack[-1]
+          for dependent in dependents:
+            if dependent not in visited:
+              visited.add(dependent)
+              stack.append((dependent, iter(inverted_deps.get(dependent, ()))))
+              break
+          else:
+            stack.pop()
+            ordered.append(target)
 
     return ordered
 
@@ -215,8 +234,8 @@ class InternalTarget(Target):
           self._dependencies.add(resolved_dependency)
           if isinstance(resolved_dependency, InternalTarget):
             self._internal_dependencies.add(resolved_dependency)
-      self._jar_dependencies = OrderedSet(filter(lambda tgt: isinstance(tgt, JarDependency),
-                                                 self._dependencies - self._internal_dependencies))
+          elif isinstance(resolved_dependency, JarDependency):
+            self._jar_dependencies.add(resolved_dependency)
 
   def valid_dependency(self, dep):
     """Subclasses can over-ride to reject invalid dependencies."""
@@ -249,7 +268,9 @@ class InternalTarget(Target):
     # so we can do a better job propagating their exclusives quickly.
     if self.exclusives is not None:
       return
-    self.exclusives = copy.deepcopy(self.declared_exclusives)
+    # The exclusives values are sets of strings, so copying each set is a sufficiently deep copy.
+    self.exclusives = collections.defaultdict(set, ((key, set(values)) for key, values in
+                                                    self.declared_exclusives.items()))
     for t in self.dependencies:
       if isinstance(t, Target):
         t._propagate_exclusives()
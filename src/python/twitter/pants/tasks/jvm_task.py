@@ -32,21 +32,28 @@ class JvmTask(Task):
     classpath = list(cp) if cp else []
     exclusives_classpath = exclusives_classpath or []
 
-    classpath.extend(path for conf, path in exclusives_classpath if not confs or conf in confs)
-
-    def add_resource_paths(predicate):
+    if confs:
+      confs = frozenset(confs)
+      classpath.extend(path for conf, path in exclusives_classpath if conf in confs)
+    else:
+      classpath.extend(path for _, path in exclusives_classpath)
+
+    parallel_src_paths = self.context.config.getbool('jvm', 'parallel_src_paths', default=False)
+    parallel_test_paths = self.context.config.getbool('jvm', 'parallel_test_paths', default=False)
+    if parallel_src_paths or parallel_test_paths:
+      # Historically both settings select the same non-test jvm targets, so their resource paths
+      # are collected in a single pass.
+      buildroot = get_buildroot()
+      resource_paths = []
       bases = set()
-      for target in self.context.targets():
-        if predicate(target):
-          if target.target_base not in bases:
-            sibling_resources_base = os.path.join(os.path.dirname(target.target_base), 'resources')
-            classpath.append(os.path.join(get_buildroot(), sibling_resources_base))
-            bases.add(target.target_base)
-
-    if self.context.config.getbool('jvm', 'parallel_src_paths', default=False):
-      add_resource_paths(lambda t: t.is_jvm and not t.is_test)
-
-    if self.context.config.getbool('jvm', 'parallel_test_paths', default=False):
-      add_resource_paths(lambda t: t.is_jvm and not t.is_test)
+      for target in self.context.targets(lambda t: t.is_jvm and not t.is_test):
+        if target.target_base not in bases:
+          sibling_resources_base = os.path.join(os.path.dirname(target.target_base), 'resources')
+          resource_paths.append(os.path.join(buildroot, sibling_resources_base))
+          bases.add(target.target_base)
+      if parallel_src_paths:
+        classpath.extend(resource_paths)
+      if parallel_test_paths:
+        classpath.extend(resource_paths)
 
     return classpath
@@ -1,6 +1,6 @@
 from __future__ import print_function
 
-from collections import defaultdict
+from collections import defaultdict, deque
 import copy
 
 from twitter.common.lang import Compatibility
@@ -72,25 +72,24 @@ class PathFinder(ConsoleTask):
 
     return cls.all_paths[from_target][to_target]
 
-  examined_targets = set()
-
   @classmethod
   def _find_path(cls, from_target, to_target, log):
     from_target, to_target = cls._coerce_to_targets(from_target, to_target)
 
     log.debug('Looking for path from %s to %s' % (from_target.address.reference(), to_target.address.reference()))
 
-    queue = [([from_target], 0)]
+    examined_targets = set()
+    queue = deque([([from_target], 0)])
     while True:
       if not queue:
         print('no path found from %s to %s!' % (from_target.address.reference(), to_target.address.reference()))
         break
 
-      path, indent = queue.pop(0)
+      path, indent = queue.popleft()
       next_target = path[-1]
-      if next_target in cls.examined_targets:
+      if next_target in examined_targets:
         continue
-      cls.examined_targets.add(next_target)
+      examined_targets.add(next_target)
 
       log.debug('%sexamining %s' % ('  ' * indent, next_target))
 
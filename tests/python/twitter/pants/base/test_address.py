@@ -78,3 +78,17 @@ class AddressTest(unittest.TestCase):
 
         with pytest.raises(IOError):
           Address.parse(root_dir, 'b/c', is_relative=False)
+
+  def test_parse_memoized(self):
+    with self.workspace('a/BUILD') as root_dir:
+      address = Address.parse(root_dir, 'a:b', is_relative=False)
+      self.assertTrue(address is Address.parse(root_dir, 'a:b', is_relative=False))
+      self.assertFalse(address is Address.parse(root_dir, 'a:c', is_relative=False))
+
+  def test_parse_cache_cleared(self):
+    with self.workspace('a/BUILD') as root_dir:
+      Address.parse(root_dir, 'a:b', is_relative=False)
+      os.unlink(os.path.join(root_dir, 'a/BUILD'))
+      Address._clear_parse_cache()
+      with pytest.raises(IOError):
+        Address.parse(root_dir, 'a:b', is_relative=False)
@@ -65,3 +65,19 @@ def test_needs_update_after_change():
     assert cache.needs_update(key)
     cache.update(key)
     assert not cache.needs_update(key)
+
+
+def test_update_visible_to_new_invalidator():
+  with temporary_dir() as d:
+    with tempfile.NamedTemporaryFile() as f:
+      f.write(TEST_CONTENT)
+      f.flush()
+      key = CacheKeyGenerator().key_for('test', [f.name])
+      cache = BuildInvalidator(d)
+      assert cache.existing_hash('test') is None
+      cache.update(key)
+      assert cache.existing_hash('test') == key.hash
+      assert not BuildInvalidator(d).needs_update(key)
+      cache.force_invalidate(key)
+      assert cache.needs_update(key)
+      assert BuildInvalidator(d).needs_update(key)
@@ -83,6 +83,16 @@ class TestArtifactCache(unittest.TestCase):
         self.do_test_artifact_cache(artifact_cache)
 
 
+  def test_local_cache_uncompressed(self):
+    with temporary_dir() as artifact_root:
+      with temporary_dir() as cache_root:
+        artifact_cache = LocalArtifactCache(None, artifact_root, cache_root, compress=False)
+        self.do_test_artifact_cache(artifact_cache)
+        key = CacheKey('muppet_key', 'fake_hash', 42, [])
+        self.assertEquals(os.path.join(cache_root, 'muppet_key', 'fake_hash.tar'),
+                          artifact_cache._cache_file_for_key(key))
+
+
   def test_restful_cache(self):
     httpd = None
     httpd_thread = None
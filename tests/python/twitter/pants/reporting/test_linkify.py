@@ -52,3 +52,10 @@ class RunInfoTest(unittest.TestCase):
     self._do_test_linkify('/browse/foo/bar/BUILD', 'foo/bar')
     self._do_test_linkify('/browse/foo/bar/BUILD', 'foo/bar:target')
 
+
+  def test_linkify_file_created_later(self):
+    relpath = 'generated/later/baz'
+    s = 'foo %s bar' % relpath
+    self.assertEqual(s, linkify(self._buildroot, s))
+    ensure_file_exists(os.path.join(self._buildroot, relpath))
+    self._do_test_linkify('/browse/%s' % relpath, relpath)